@@ -1,9 +1,11 @@
 import streamlit as st
 import re
-import secrets
+import os
 import string
+from dataclasses import dataclass
+from pathlib import Path
 from zxcvbn import zxcvbn
-from typing import Dict, List, Union
+from typing import Dict, FrozenSet, List, Tuple, Union
 
 # Configuration
 st.set_page_config(
@@ -13,8 +15,61 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for modern UI
-st.markdown("""
+# Maps ASCII letters/digits to a class marker; everything else is left as-is and counts as special
+_CHAR_CLASSES = str.maketrans({
+    **dict.fromkeys(string.ascii_uppercase, 'U'),
+    **dict.fromkeys(string.ascii_lowercase, 'L'),
+    **dict.fromkeys(string.digits, 'D'),
+})
+
+# Common-password blocklist (top 10,000 of the Xato 10M-password corpus ranking shipped with zxcvbn 4.5.0),
+# loaded once per server process and shared across sessions
+@st.cache_resource(show_spinner=False)
+def _load_common_passwords() -> FrozenSet[str]:
+    path = Path(__file__).with_name("common_passwords.txt")
+    with path.open(encoding="utf-8") as f:
+        return frozenset(line.strip().lower() for line in f if line.strip())
+
+_COMMON_PASSWORDS = _load_common_passwords()
+
+# Generator charset for every checkbox combination, indexed by
+# (uppercase << 3) | (lowercase << 2) | (numbers << 1) | special; index 0 is the empty charset
+_CHARSETS = tuple(
+    (string.ascii_uppercase if key & 8 else '')
+    + (string.ascii_lowercase if key & 4 else '')
+    + (string.digits if key & 2 else '')
+    + ('!@#$%^&*()_+-=' if key & 1 else '')
+    for key in range(16)
+)
+
+# zxcvbn score (0-4) display labels and icons
+_STRENGTH_LABELS = ("Very Weak", "Weak", "Fair", "Strong", "Very Strong")
+_STRENGTH_ICONS = ("🔴", "🟠", "🟡", "🟢", "🟢")
+
+# Metrics grid: (label, color, value template) per card, pre-rendered into one
+# HTML template that the results panel fills with str.format
+_METRIC_TEMPLATES = (
+    ("Length", "#4b6cb7", "{length} chars"),
+    ("Complexity", "#2ecc71", "{complexity}/4"),
+    ("Predictability", "#e74c3c", "{predictability}"),
+    ("Entropy", "#f1c40f", "{entropy:.1f} bits"),
+)
+_METRICS_GRID_HTML = (
+    '<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(8rem, 1fr)); gap: 1rem;">'
+    + ''.join(
+        f'<div style="text-align: center; padding: 1rem; background: {color}10; border-radius: 8px;">'
+        f'<div style="color: {color}; font-weight: 600; margin-bottom: 0.5rem;">{label}</div>'
+        f'<div style="font-size: 1.2rem; font-weight: 700;">{value}</div>'
+        '</div>'
+        for label, color, value in _METRIC_TEMPLATES
+    )
+    + '</div>'
+)
+
+# Custom CSS for modern UI, minified once per server process since it is re-sent on every full rerun
+@st.cache_resource(show_spinner=False)
+def _page_css() -> str:
+    css = """
     <style>
     /* Main container styling */
     .main {
@@ -76,7 +131,7 @@ st.markdown("""
     }
     
     /* Button styling */
-    .stButton button {
+    .stButton button, .stFormSubmitButton button {
         border-radius: 8px!important;
         padding: 10px 24px!important;
         background: linear-gradient(135deg, #4b6cb7 0%, #182848 100%);
@@ -85,7 +140,7 @@ st.markdown("""
         color: white;
     }
     
-    .stButton button:hover {
+    .stButton button:hover, .stFormSubmitButton button:hover {
         transform: translateY(-2px);
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         color: rgb(224, 215, 215)
@@ -102,37 +157,81 @@ st.markdown("""
         animation: pulse 2s infinite;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    return re.sub(r'\s+', ' ', css).strip()
+
+st.markdown(_page_css(), unsafe_allow_html=True)
+
+# Password analysis result
+@dataclass(slots=True)
+class PasswordAnalysis:
+    length: int
+    uppercase: bool
+    lowercase: bool
+    numbers: bool
+    special: bool
+    common_patterns: bool
+    repeats: bool
+    in_blocklist: bool
+    complexity_count: int
 
 # Password analysis function
-def analyze_password(password: str) -> Dict[str, Union[bool, int]]:
-    analysis = {
-        'length': len(password),
-        'uppercase': bool(re.search(r'[A-Z]', password)),
-        'lowercase': bool(re.search(r'[a-z]', password)),
-        'numbers': bool(re.search(r'[0-9]', password)),
-        'special': bool(re.search(r'[^A-Za-z0-9]', password)),
-        'common_patterns': bool(re.search(r'(123|abc|password|qwerty)', password.lower())),
-        'repeats': bool(re.search(r'(.)\1{2,}', password)),
-    }
-    return analysis
+def analyze_password(password: str) -> PasswordAnalysis:
+    # One C-level translate pass, then look up which class markers are present
+    classes = set(password.translate(_CHAR_CLASSES))
+    upper = 'U' in classes
+    lower = 'L' in classes
+    digit = 'D' in classes
+    other = not classes <= {'U', 'L', 'D'}
+
+    # Run-length tracking for 3+ identical characters in a row, stopping at the first run
+    repeats = False
+    prev, run_len = None, 0
+    for ch in password:
+        if ch == prev:
+            run_len += 1
+            if run_len >= 3:
+                repeats = True
+                break
+        else:
+            prev, run_len = ch, 1
+
+    # Substrings that mark a password as predictable, tested as chained `in` checks
+    # (cheaper than a generator over a pattern tuple or a regex alternation)
+    pwl = password.lower()
+    common_patterns = '123' in pwl or 'abc' in pwl or 'password' in pwl or 'qwerty' in pwl
+    return PasswordAnalysis(
+        length=len(password),
+        uppercase=upper,
+        lowercase=lower,
+        numbers=digit,
+        special=other,
+        common_patterns=common_patterns,
+        repeats=repeats,
+        in_blocklist=pwl in _COMMON_PASSWORDS,
+        complexity_count=upper + lower + digit + other,
+    )
+
+# Cached zxcvbn lookup, so reruns with an unchanged password skip the dictionary matching.
+# Only (score, guesses_log10) is kept; the full result holds the plaintext password and matched tokens.
+@st.cache_data(max_entries=256, ttl=300, show_spinner=False)
+def _zxcvbn_cached(password: str) -> Tuple[int, float]:
+    result = zxcvbn(password)
+    return result['score'], result['guesses_log10']
 
 # Strength calculation
-def calculate_strength(analysis: Dict[str, Union[bool, int]]) -> Dict[str, Union[str, int]]:
-    score = 0
-    
-    # Additive factors
-    score += min(analysis['length'] * 2, 20)  # Max 20 for length
-    score += 5 * sum([analysis['uppercase'], analysis['lowercase'], 
-                     analysis['numbers'], analysis['special']])
-    
-    # Deductions
-    if analysis['common_patterns']:
-        score -= 15
-    if analysis['repeats']:
-        score -= 10
-    if analysis['length'] < 8:
-        score -= 20
+def calculate_strength(analysis: PasswordAnalysis) -> Dict[str, Union[str, int]]:
+    length = analysis.length
+
+    # Additive factors (max 20 for length) minus deductions; the flags are bools,
+    # so each deduction is a multiply rather than a branch. Short length first,
+    # as it is the most common deduction.
+    score = (min(length * 2, 20)
+             + 5 * analysis.complexity_count
+             - 20 * (length < 8)
+             - 15 * analysis.common_patterns
+             - 10 * analysis.repeats)
     
     # Normalize score
     score = max(0, min(score, 100))
@@ -145,127 +244,116 @@ def calculate_strength(analysis: Dict[str, Union[bool, int]]) -> Dict[str, Union
     else:
         return {'strength': 'Strong', 'score': score, 'color': '#2ecc71'}
 
-# AI-powered suggestions generator
-def generate_suggestions(analysis: Dict[str, Union[bool, int]]) -> List[str]:
-    suggestions = []
-    
-    if analysis['length'] < 12:
-        suggestions.append("🔍 Increase length to at least 12 characters")
-    if not analysis['uppercase']:
-        suggestions.append("🔠 Add uppercase letters")
-    if not analysis['lowercase']:
-        suggestions.append("🔡 Add lowercase letters")
-    if not analysis['numbers']:
-        suggestions.append("🔢 Include numbers")
-    if not analysis['special']:
-        suggestions.append("⚡ Add special characters (!@#$%^ etc.)")
-    if analysis['common_patterns']:
-        suggestions.append("🚫 Avoid common patterns and dictionary words")
-    if analysis['repeats']:
-        suggestions.append("♻️ Reduce repeating characters")
-    
+# Suggestion rules, in display order: (predicate over the analysis, message)
+_SUGGESTION_RULES = (
+    (lambda a: a.length < 12, "🔍 Increase length to at least 12 characters"),
+    (lambda a: not a.uppercase, "🔠 Add uppercase letters"),
+    (lambda a: not a.lowercase, "🔡 Add lowercase letters"),
+    (lambda a: not a.numbers, "🔢 Include numbers"),
+    (lambda a: not a.special, "⚡ Add special characters (!@#$%^ etc.)"),
+    (lambda a: a.common_patterns, "🚫 Avoid common patterns and dictionary words"),
+    (lambda a: a.repeats, "♻️ Reduce repeating characters"),
+    (lambda a: a.in_blocklist, "⛔ This password appears in common password lists"),
     # Advanced heuristic suggestions
-    if analysis['length'] >= 8 and analysis['length'] < 12:
-        suggestions.append("💡 Try using a passphrase instead of random characters")
-    if len(suggestions) == 0:
+    (lambda a: 8 <= a.length < 12, "💡 Try using a passphrase instead of random characters"),
+)
+
+# AI-powered suggestions generator
+def generate_suggestions(analysis: PasswordAnalysis) -> List[str]:
+    suggestions = [message for applies, message in _SUGGESTION_RULES if applies(analysis)]
+    if not suggestions:
         suggestions.append("✅ Excellent password! Consider using a password manager to store it securely.")
-    
     return suggestions
 
 # Secure password generator
 def generate_password(length: int = 12, uppercase: bool = True, 
                      lowercase: bool = True, numbers: bool = True, 
                      special: bool = True) -> str:
-    characters = ''
-    if uppercase: characters += string.ascii_uppercase
-    if lowercase: characters += string.ascii_lowercase
-    if numbers: characters += string.digits
-    if special: characters += '!@#$%^&*()_+-='
+    characters = _CHARSETS[(uppercase << 3) | (lowercase << 2) | (numbers << 1) | special]
     
     if not characters:
         return "Please select at least one character type"
     
-    return ''.join(secrets.choice(characters) for _ in range(length))
+    # One urandom draw for the whole password, mapped to characters by a single
+    # bytes.translate: the table sends byte b to characters[b % n], and bytes
+    # >= limit are deleted so the modulo reduction stays unbiased
+    encoded = characters.encode('ascii')
+    n = len(encoded)
+    limit = 256 - 256 % n
+    table = (encoded * (256 // n + 1))[:256]
+    rejected = bytes(range(limit, 256))
+    out = b''
+    while len(out) < length:
+        out += os.urandom(length * 2).translate(table, rejected)
+    return out[:length].decode('ascii')
 
 # UI Components
-def main() -> None:
-    # Hero Section
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.title("🔐 SecurePass Pro")
-        st.markdown("<h3 style='font-weight: 400;'>Enterprise-grade Password Security Analysis</h3>", unsafe_allow_html=True)
-    with col2:
-        st.image("https://cdn-icons-png.flaticon.com/512/3064/3064155.png", width=100)
-
-    # Main Card Container
-    with st.container():
-        # Password Input Section
+# Analysis panel; a fragment, so submitting the form reruns only this section
+@st.fragment
+def _analysis_panel() -> None:
+    # Password Input Section (batched in a form so analysis runs once per submit)
+    with st.form("analysis_form", border=False):
         password = st.text_input(
                 "Enter password to analyze:",
                 type="password",
-                help="Start typing to see real-time analysis",
+                help="Press Enter or click Analyze Now to see the analysis",
                 key="pw_input"
             )
-        st.button('Analyze Now', key="analyze_btn")
-
-        if password:
-            # Analysis Results
-            result = zxcvbn(password)
-            score = result['score']
-            analysis = analyze_password(password)
-            suggestions = generate_suggestions(analysis)
-            
-            # Strength Visualization
-            with st.container():
-                strength_labels = ["Very Weak", "Weak", "Fair", "Strong", "Very Strong"]
-                progress_percent = (score + 1) * 20
-
-                # Header with animated icon
-                st.markdown(f"""
-                    <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                        <span class='pulse-icon' style='font-size: 32px;'>{"🔴🟠🟡🟢🟢"[score]}</span>
-                        <h3 style='margin: 0;'>Security Assessment</h3>
+        st.form_submit_button('Analyze Now')
+
+    if password:
+        # Analysis Results
+        score, guesses_log10 = _zxcvbn_cached(password)
+        analysis = analyze_password(password)
+        suggestions = generate_suggestions(analysis)
+        
+        # Strength Visualization
+        with st.container():
+            progress_percent = (score + 1) * 20
+
+            # Header with animated icon
+            st.markdown(f"""
+                <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
+                    <span class='pulse-icon' style='font-size: 32px;'>{_STRENGTH_ICONS[score]}</span>
+                    <h3 style='margin: 0;'>Security Assessment</h3>
+                </div>
+            """, unsafe_allow_html=True)
+
+            # Progress bar with score
+            st.markdown(f"""
+                <div style="margin-bottom: 1.5rem;">
+                    <div class="progress-bar">
+                        <div class="progress-bar-fill score-{score}" style="width: {progress_percent}%;"></div>
                     </div>
-                """, unsafe_allow_html=True)
-
-                # Progress bar with score
-                st.markdown(f"""
-                    <div style="margin-bottom: 1.5rem;">
-                        <div class="progress-bar">
-                            <div class="progress-bar-fill score-{score}" style="width: {progress_percent}%;"></div>
-                        </div>
-                        <div style="display: flex; justify-content: space-between; margin-top: 0.5rem;">
-                            <span class='text-{score}' style='font-weight: 600;'>{strength_labels[score]}</span>
-                            <span style='color: #7f8c8d;'>Score: {analysis['length']}/24</span>
-                        </div>
+                    <div style="display: flex; justify-content: space-between; margin-top: 0.5rem;">
+                        <span class='text-{score}' style='font-weight: 600;'>{_STRENGTH_LABELS[score]}</span>
+                        <span style='color: #7f8c8d;'>Score: {analysis.length}/24</span>
                     </div>
-                """, unsafe_allow_html=True)
-
-                # Metrics Grid
-                cols = st.columns(4)
-                metrics = [
-                    ("Length", f"{analysis['length']} chars", "#4b6cb7"),
-                    ("Complexity", f"{sum([analysis['uppercase'], analysis['lowercase'], analysis['numbers'], analysis['special']])}/4", "#2ecc71"),
-                    ("Predictability", "High" if analysis['common_patterns'] else "Low", "#e74c3c"),
-                    ("Entropy", f"{result['guesses_log10']:.1f} bits", "#f1c40f")
-                ]
-                
-                for col, (label, value, color) in zip(cols, metrics):
-                    with col:
-                        st.markdown(f"""
-                            <div style="text-align: center; padding: 1rem; background: {color}10; border-radius: 8px;">
-                                <div style="color: {color}; font-weight: 600; margin-bottom: 0.5rem;">{label}</div>
-                                <div style="font-size: 1.2rem; font-weight: 700;">{value}</div>
-                            </div>
-                        """, unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)  # Close card
-
-            # Recommendations Section
-            with st.container():
-                st.markdown("### 🔍 Security Recommendations")
-                
-                # Two-column layout for suggestions
+                </div>
+            """, unsafe_allow_html=True)
+
+            # Metrics Grid (one markdown element instead of one per column)
+            st.markdown(
+                _METRICS_GRID_HTML.format(
+                    length=analysis.length,
+                    complexity=analysis.complexity_count,
+                    predictability="High" if analysis.common_patterns or analysis.in_blocklist else "Low",
+                    entropy=guesses_log10,
+                ),
+                unsafe_allow_html=True
+            )
+            
+            st.markdown("</div>", unsafe_allow_html=True)  # Close card
+
+        # Recommendations Section
+        with st.container():
+            st.markdown("### 🔍 Security Recommendations")
+            
+            # Two-column layout for suggestions; a single suggestion skips the column layout
+            if len(suggestions) <= 1:
+                for suggestion in suggestions:
+                    st.markdown(f"<div style='padding: 0.5rem; border-left: 3px solid #4b6cb7; margin: 0.5rem 0;'>📌 {suggestion}</div>", unsafe_allow_html=True)
+            else:
                 rec_cols = st.columns(2)
                 with rec_cols[0]:
                     for suggestion in suggestions[:len(suggestions)//2]:
@@ -273,23 +361,42 @@ def main() -> None:
                 with rec_cols[1]:
                     for suggestion in suggestions[len(suggestions)//2:]:
                         st.markdown(f"<div style='padding: 0.5rem; border-left: 3px solid #4b6cb7; margin: 0.5rem 0;'>📌 {suggestion}</div>", unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)  # Close card
+            
+            st.markdown("</div>", unsafe_allow_html=True)  # Close card
+
+# Password generator panel; a fragment, so its widgets rerun only this section
+@st.fragment
+def _generator_panel() -> None:
+    with st.expander("✨ Advanced Password Generator", expanded=True):
+        st.markdown("### Create Secure Password")
+        length = st.slider("Length", 8, 24, 16, key="gen_length")
+        char_types = st.columns(4)
+        with char_types[0]: uppercase = st.checkbox("A-Z", True)
+        with char_types[1]: lowercase = st.checkbox("a-z", True)
+        with char_types[2]: numbers = st.checkbox("0-9", True)
+        with char_types[3]: special = st.checkbox("!@#", True)
+            
+        if st.button("Generate Password", key="generate_btn"):
+            new_pw: str = generate_password(length, uppercase, lowercase, numbers, special)
+            st.code(new_pw)
+            st.success("Password generated! Copy it to a secure location.")
+
+# Page layout
+def main() -> None:
+    # Hero Section
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.title("🔐 SecurePass Pro")
+        st.markdown("<h3 style='font-weight: 400;'>Enterprise-grade Password Security Analysis</h3>", unsafe_allow_html=True)
+    with col2:
+        st.image("https://cdn-icons-png.flaticon.com/512/3064/3064155.png", width=100)
+
+    # Main Card Container
+    with st.container():
+        _analysis_panel()
 
         # Password Generator
-        with st.expander("✨ Advanced Password Generator", expanded=True):
-            st.markdown("### Create Secure Password")
-            length = st.slider("Length", 8, 24, 16, key="gen_length")
-            char_types = st.columns(4)
-            with char_types[0]: uppercase = st.checkbox("A-Z", True)
-            with char_types[1]: lowercase = st.checkbox("a-z", True)
-            with char_types[2]: numbers = st.checkbox("0-9", True)
-            with char_types[3]: special = st.checkbox("!@#", True)
-                
-            if st.button("Generate Password", key="generate_btn"):
-                new_pw: str = generate_password(length, uppercase, lowercase, numbers, special)
-                st.code(new_pw)
-                st.success("Password generated! Copy it to a secure location.")
+        _generator_panel()
 
         with st.expander("ℹ️ Password Security Guide"):
             st.markdown("""